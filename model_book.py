@@ -1,7 +1,100 @@
-from copy import deepcopy
+import copy
+from collections.abc import MutableMapping
+from functools import lru_cache, partial
+from operator import itemgetter
 
 from flappy import models as flm
 
+class _LazyModelDict(MutableMapping):
+    """
+    A dictionary of models that are constructed on first access.
+
+    Values are set as parameter-free factories, e.g. model classes
+    or functools.partial objects. The factory is invoked on first
+    item access and the constructed model is memoized, so repeated
+    access returns the same object.
+
+    Parameters
+    ----------
+    factories: dict, optional
+        Initial mapping from model name to factory
+
+    """
+
+    def __init__(self, factories=None):
+        self._factories = dict(factories) if factories is not None else {}
+        self._models = {}
+
+    def __getitem__(self, mname):
+        try:
+            return self._models[mname]
+        except KeyError:
+            m = self._factories[mname]()
+            self._models[mname] = m
+            return m
+
+    def __setitem__(self, mname, factory):
+        self._factories[mname] = factory
+        self._models.pop(mname, None)
+
+    def __delitem__(self, mname):
+        del self._factories[mname]
+        self._models.pop(mname, None)
+
+    def __iter__(self):
+        return iter(self._factories)
+
+    def __len__(self):
+        return len(self._factories)
+
+    def is_built(self, mname):
+        """
+        Check if a model has been constructed already
+
+        Parameters
+        ----------
+        mname: str
+            The model name
+
+        Returns
+        -------
+        built: bool
+            True if the model has been constructed
+
+        """
+        return mname in self._models
+
+def _model_str(mdict, mname):
+    """
+    String for a model entry, without triggering lazy construction
+
+    Parameters
+    ----------
+    mdict: dict
+        The model dictionary
+    mname: str
+        The model name
+
+    Returns
+    -------
+    str:
+        The model's string, or '<not built>'
+
+    """
+    if isinstance(mdict, _LazyModelDict) and not mdict.is_built(mname):
+        return "<not built>"
+    return str(mdict[mname])
+
+# model categories filtered by ModelBook.reduce:
+# (ModelBook attribute, turbine info key, info entry is a list)
+_REDUCE_SPEC = (
+    ('rotor_models',   'rotor_model',    False),
+    ('turbine_models', 'turbine_models', True),
+    ('controllers',    'controller',     False),
+    ('wake_models',    'wake_models',    True),
+    ('wake_frames',    'wake_frame',     False),
+)
+
 class ModelBook:
     """
     A collection of models, ready to use in run scripts.
@@ -35,111 +128,159 @@ class ModelBook:
 
     """
 
+    __slots__ = ('amb_states_models', 'rotor_models', 'turbine_models',
+                 'turbine_orders', 'controllers', 'wake_models',
+                 'wake_superp', 'wake_frames', 'farm_calc_data_models',
+                 'vert_profiles')
+
     def __init__(
-            self, 
+            self,
             ct_power_curve_file=None
         ):
 
+        # share the model dictionaries of the cached template
+        # book, built once per ct_power_curve_file:
+        template = _build_template(ct_power_curve_file)
+        for attr in self.__slots__:
+            setattr(self, attr, getattr(template, attr))
+
+    def _populate(
+            self,
+            ct_power_curve_file=None
+        ):
+        """
+        Fill all model dictionaries
+
+        Parameters
+        ----------
+        ct_power_curve_file: str, optional
+            The turbine curves file, forwarded to
+            flappy.WS2PCT
+
+        """
+
         # define ambient states models:
-        self.amb_states_models = {}
+        self.amb_states_models = _LazyModelDict()
 
         # define rotor models:
 
-        self.rotor_models = {}
-        self.rotor_models['centre']  = flm.RMCentre()
-        self.rotor_models['stencil'] = flm.RMStencil() 
-
-        for n in range(3,13):
-            self.rotor_models['ring' + str(n + 1)] = flm.RMRing(n=n)
-        self.rotor_models['two_rings9']    = flm.RMRings(m=[4,4],angle0_deg=[45,0])
-        self.rotor_models['two_rings13']   = flm.RMRings(m=[4, 8])
-        self.rotor_models['three_rings19'] = flm.RMRings(m=[4,6,8])
-        self.rotor_models['four_rings29'] = flm.RMRings(m=[4,6,8,10])
-        for n in range(2,11):
-            self.rotor_models['grid' + str(n*n)] = flm.RMGrid(n=n)
-        self.rotor_models['grid400'] = flm.RMGrid(n=20)
-        self.rotor_models['grid10000'] = flm.RMGrid(n=100)
+        self.rotor_models = _LazyModelDict({
+            'centre':  flm.RMCentre,
+            'stencil': flm.RMStencil,
+            **{f'ring{n+1}': partial(flm.RMRing, n=n) for n in range(3,13)},
+            'two_rings9':    partial(flm.RMRings, m=[4,4], angle0_deg=[45,0]),
+            'two_rings13':   partial(flm.RMRings, m=[4, 8]),
+            'three_rings19': partial(flm.RMRings, m=[4,6,8]),
+            'four_rings29':  partial(flm.RMRings, m=[4,6,8,10]),
+            **{f'grid{n*n}': partial(flm.RMGrid, n=n) for n in range(2,11)},
+            'grid400':   partial(flm.RMGrid, n=20),
+            'grid10000': partial(flm.RMGrid, n=100),
+        })
 
         # define turbine models:
-        self.turbine_models = {}
+        self.turbine_models = _LazyModelDict({
+            'yaw2yawm':        partial(flm.Yaw2Yawm, ambient_wd=True, ambient_yaw=False),
+            'yawm2yaw':        partial(flm.Yawm2Yaw, ambient_wd=True, ambient_yaw=False),
+            'zeroOutsideFarm': flm.ZeroOutsideFarm,
+        })
         if ct_power_curve_file is not None:
-            self.turbine_models['ct_P_curves'] = flm.Ws2PCt(ct_power_curve_file=ct_power_curve_file)
-        self.turbine_models['yaw2yawm']        = flm.Yaw2Yawm(ambient_wd=True, ambient_yaw=False)
-        self.turbine_models['yawm2yaw']        = flm.Yawm2Yaw(ambient_wd=True, ambient_yaw=False)
-        self.turbine_models['zeroOutsideFarm'] = flm.ZeroOutsideFarm()
+            self.turbine_models['ct_P_curves'] = partial(flm.Ws2PCt, ct_power_curve_file=ct_power_curve_file)
 
         # define turbine orders:
-        self.turbine_orders = {}
-        self.turbine_orders['farm']       = flm.FarmTurbineOrder()
-        self.turbine_orders['amb_wind']   = flm.WindTurbineOrder(use_amb=True)
-        self.turbine_orders['wake_wind']  = flm.WindTurbineOrder(use_amb=False)
-        self.turbine_orders['wake_frame'] = flm.WakeFrameTurbineOrder()
+        self.turbine_orders = _LazyModelDict({
+            'farm':       flm.FarmTurbineOrder,
+            'amb_wind':   partial(flm.WindTurbineOrder, use_amb=True),
+            'wake_wind':  partial(flm.WindTurbineOrder, use_amb=False),
+            'wake_frame': flm.WakeFrameTurbineOrder,
+        })
 
         # define controllers:
-        self.controllers = {}
-        self.controllers['default'] = flm.WTCDefault()
+        self.controllers = _LazyModelDict({
+            'default': flm.WTCDefault,
+        })
 
         # define wake models:
-        self.wake_models = {}
-        self.wake_models['Jensen']            = flm.WMJensen()
-        self.wake_models['Jensen007']         = flm.WMJensen(k=0.07)
-        self.wake_models['Frandsen']          = flm.WMFrandsen()
-        self.wake_models['Bastankhah']        = flm.WMBastankhah()
-        self.wake_models['Bastankhah_smear3'] = flm.WMBastankhah(delta_wd=3.)
-        self.wake_models['PorteAgel']         = flm.WMPorteAgel()
-        self.wake_models['Botasso']           = flm.WMBotasso()
-        self.wake_models['Ishihara_wind']     = flm.WMIshiharaWind()
-        self.wake_models['Ishihara_ti']       = flm.WMIshiharaTI()
-        self.wake_models['IEC_TI_2005']       = flm.WMIECTI2005()
-        self.wake_models['IEC_TI_2019']       = flm.WMIECTI2019()
-        self.wake_models['CrespoHernandez']   = flm.WMTICrespoHernandez()
+        self.wake_models = _LazyModelDict({
+            'Jensen':            flm.WMJensen,
+            'Jensen007':         partial(flm.WMJensen, k=0.07),
+            'Frandsen':          flm.WMFrandsen,
+            'Bastankhah':        flm.WMBastankhah,
+            'Bastankhah_smear3': partial(flm.WMBastankhah, delta_wd=3.),
+            'PorteAgel':         flm.WMPorteAgel,
+            'Botasso':           flm.WMBotasso,
+            'Ishihara_wind':     flm.WMIshiharaWind,
+            'Ishihara_ti':       flm.WMIshiharaTI,
+            'IEC_TI_2005':       flm.WMIECTI2005,
+            'IEC_TI_2019':       flm.WMIECTI2019,
+            'CrespoHernandez':   flm.WMTICrespoHernandez,
+        })
 
         # add nopartial-models:
         wmodels = list(self.wake_models.keys())
         for mname in wmodels:
-            m = self.wake_models[mname]
-            if m.partial_wakes:
-                mname2 = mname + "_rotor"
-                self.wake_models[mname2] = deepcopy(m)
-                self.wake_models[mname2].partial_wakes = False
+            self.wake_models[mname + "_rotor"] = partial(self._no_partial_wakes, mname)
 
         # define induction models:
-        #self.wake_models['Troldborg'] = flm.IMTroldborg()
-        #self.wake_models['RankineHB'] = flm.IMRankineHB()
-        #self.wake_models['VortexM']   = flm.IMVortexModel()
-        
+        #self.wake_models['Troldborg'] = flm.IMTroldborg
+        #self.wake_models['RankineHB'] = flm.IMRankineHB
+        #self.wake_models['VortexM']   = flm.IMVortexModel
+
         # define wake superposition models:
-        self.wake_superp = {}
-        self.wake_superp['ti_linear']              = flm.TISuperpCollection(ti_superp='linear')
-        self.wake_superp['ti_quadratic']           = flm.TISuperpCollection(ti_superp='quadratic')
-        self.wake_superp['ti_max']                 = flm.TISuperpCollection(ti_superp='max')
-        self.wake_superp['wind_linear']            = flm.WindSuperpLinear(use_ambws=False, limit_wake=False)
-        self.wake_superp['wind_linear_amb']        = flm.WindSuperpLinear(use_ambws=True, limit_wake=False)
-        self.wake_superp['wind_linear_lim']        = flm.WindSuperpLinear(use_ambws=False, limit_wake=True)
-        self.wake_superp['wind_linear_amb_lim']    = flm.WindSuperpLinear(use_ambws=True, limit_wake=True)
-        self.wake_superp['wind_quadratic']         = flm.WindSuperpQuadratic(use_ambws=False ,limit_wake=False)
-        self.wake_superp['wind_quadratic_amb']     = flm.WindSuperpQuadratic(use_ambws=True, limit_wake=False)
-        self.wake_superp['wind_quadratic_lim']     = flm.WindSuperpQuadratic(use_ambws=False, limit_wake=True)
-        self.wake_superp['wind_quadratic_amb_lim'] = flm.WindSuperpQuadratic(use_ambws=True, limit_wake=True)
-        self.wake_superp['wind_product']           = flm.WindSuperpProduct()
+        self.wake_superp = _LazyModelDict({
+            'ti_linear':              partial(flm.TISuperpCollection, ti_superp='linear'),
+            'ti_quadratic':           partial(flm.TISuperpCollection, ti_superp='quadratic'),
+            'ti_max':                 partial(flm.TISuperpCollection, ti_superp='max'),
+            'wind_linear':            partial(flm.WindSuperpLinear, use_ambws=False, limit_wake=False),
+            'wind_linear_amb':        partial(flm.WindSuperpLinear, use_ambws=True, limit_wake=False),
+            'wind_linear_lim':        partial(flm.WindSuperpLinear, use_ambws=False, limit_wake=True),
+            'wind_linear_amb_lim':    partial(flm.WindSuperpLinear, use_ambws=True, limit_wake=True),
+            'wind_quadratic':         partial(flm.WindSuperpQuadratic, use_ambws=False, limit_wake=False),
+            'wind_quadratic_amb':     partial(flm.WindSuperpQuadratic, use_ambws=True, limit_wake=False),
+            'wind_quadratic_lim':     partial(flm.WindSuperpQuadratic, use_ambws=False, limit_wake=True),
+            'wind_quadratic_amb_lim': partial(flm.WindSuperpQuadratic, use_ambws=True, limit_wake=True),
+            'wind_product':           flm.WindSuperpProduct,
+        })
 
         # define wake centreline models:
-        self.wake_frames = {}
-        self.wake_frames['amb_wind']       = flm.AmbientWindFrame()
-        self.wake_frames['rotor_wind']     = flm.RotorWindFrame()
-        self.wake_frames['yaw_deflection'] = flm.YawDeflectionFrame()
-        self.wake_frames['streamlines']    = flm.StreamlineFrame()
+        self.wake_frames = _LazyModelDict({
+            'amb_wind':       flm.AmbientWindFrame,
+            'rotor_wind':     flm.RotorWindFrame,
+            'yaw_deflection': flm.YawDeflectionFrame,
+            'streamlines':    flm.StreamlineFrame,
+        })
 
         # define farm calc data models:
-        self.farm_calc_data_models = {}
-        self.farm_calc_data_models['cables_mst'] = flm.CablesMST()
+        self.farm_calc_data_models = _LazyModelDict({
+            'cables_mst': flm.CablesMST,
+        })
 
         # define vertical profiles:
-        self.vert_profiles = {}
-        self.vert_profiles['ws_abl_log_neutral']  = flm.vertical_profiles.ABLLogNeutralWsProfile.__name__
-        self.vert_profiles['ws_abl_log_stable']   = flm.vertical_profiles.ABLLogStableWsProfile.__name__
-        self.vert_profiles['ws_abl_log_unstable'] = flm.vertical_profiles.ABLLogUnstableWsProfile.__name__
-        self.vert_profiles['ws_abl_log']          = flm.vertical_profiles.ABLLogWsProfile.__name__
+        self.vert_profiles = {
+            'ws_abl_log_neutral':  flm.vertical_profiles.ABLLogNeutralWsProfile.__name__,
+            'ws_abl_log_stable':   flm.vertical_profiles.ABLLogStableWsProfile.__name__,
+            'ws_abl_log_unstable': flm.vertical_profiles.ABLLogUnstableWsProfile.__name__,
+            'ws_abl_log':          flm.vertical_profiles.ABLLogWsProfile.__name__,
+        }
+
+    def _no_partial_wakes(self, mname):
+        """
+        Build a copy of a wake model without partial wakes
+
+        Parameters
+        ----------
+        mname: str
+            The name of the original wake model
+
+        Returns
+        -------
+        m: flappy.models.WakeModel
+            Copy of the model, with partial_wakes
+            set to False
+
+        """
+        m = copy.copy(self.wake_models[mname])
+        m.partial_wakes = False
+        return m
 
     def __repr__(self):
         """
@@ -152,48 +293,33 @@ class ModelBook:
         
         """
 
-        out = "Rotor models:"
-        if len(self.rotor_models) == 0:
-            out += "\n  (None)"
-        else:
-            for mname, m in self.rotor_models.items():
-                out += "\n  " + mname + " -- " + str(m)
-
-        out += "\nControllers:"
-        if len(self.controllers) == 0:
-            out += "\n  (None)"
-        else:
-            for mname, m in self.controllers.items():
-                out += "\n  " + mname + " -- " + str(m)
-
-        out += "\nTurbine models:"
-        if len(self.turbine_models) == 0:
-            out += "\n  (None)"
-        else:
-            for mname, m in self.turbine_models.items():
-                out += "\n  " + mname + " -- " + str(m)
-
-        out += "\nWake centreline models:"
-        if len(self.wake_frames) == 0:
-            out += "\n  (None)"
-        else:
-            for mname, m in self.wake_frames.items():
-                out += "\n  " + mname + " -- " + str(m)
-
-        out += "\nWake models:"
-        if len(self.wake_models) == 0:
-            out += "\n  (None)"
-        else:
-            for mname, m in self.wake_models.items():
-                out += "\n  " + mname + " -- " + str(m)
-
-        return out
+        parts = []
+        for title, mdict in (
+                ("Rotor models:", self.rotor_models),
+                ("Controllers:", self.controllers),
+                ("Turbine models:", self.turbine_models),
+                ("Wake centreline models:", self.wake_frames),
+                ("Wake models:", self.wake_models),
+            ):
+            parts.append(title)
+            if len(mdict) == 0:
+                parts.append("  (None)")
+            else:
+                parts.extend(f"  {mname} -- {_model_str(mdict, mname)}"
+                                for mname in mdict)
+
+        return "\n".join(parts)
 
     def reduce(self, wind_farm):
         """
         Return a reduced version,
         only carrying required models
 
+        The unfiltered dictionaries (amb_states_models,
+        wake_superp, turbine_orders, farm_calc_data_models,
+        vert_profiles) are shared by reference with the
+        original book and must not be mutated.
+
         Parameters
         ----------
         wind_farm: flappy.WindFarm
@@ -206,27 +332,65 @@ class ModelBook:
 
         """
 
-        mbook = ModelBook()
+        # skip __init__, all attributes are set below:
+        mbook = ModelBook.__new__(ModelBook)
+        mbook.amb_states_models = self.amb_states_models
         mbook.wake_superp = self.wake_superp
         mbook.turbine_orders = self.turbine_orders
-        mtyps = ['rotor_models', 'turbine_models', 'controllers',
-                'wake_models', 'wake_frames']
-        ttyps = ['rotor_model', 'turbine_models', 'controller',
-                'wake_models', 'wake_frame']
-        for mi, mtyp in enumerate(mtyps):
-            ttyp   = ttyps[mi]
-            mdict0 = self.__dict__[mtyp]
-            mdict  = {}
-            for t in wind_farm.turbines:
-                if ttyp == 'wake_models' or ttyp == 'turbine_models':
-                    for wm in t.info[ttyp]:
-                        if not wm in mdict:
-                            mdict[wm] = mdict0[wm]
-                else:
-                    wm = t.info[ttyp]
-                    if not wm in mdict:
-                        mdict[wm] = mdict0[wm]
-
-            mbook.__dict__[mtyp] = mdict
-        
+        mbook.farm_calc_data_models = self.farm_calc_data_models
+        mbook.vert_profiles = self.vert_profiles
+
+        # collect required model names per category, with the
+        # branch on list-valued info entries hoisted out of the
+        # turbine loop via bound set methods:
+        categories = []
+        for attr, key, is_list in _REDUCE_SPEC:
+            names = set()
+            categories.append(
+                (attr, key, names, names.update if is_list else names.add))
+
+        # one pass over the turbines, reading t.info once each:
+        for t in wind_farm.turbines:
+            info = t.info
+            for attr, key, names, collect in categories:
+                collect(info[key])
+
+        # keep only the required models, fetching all of a
+        # category's entries in one itemgetter call:
+        for attr, key, names, collect in categories:
+            src = getattr(self, attr)
+            names = tuple(names)
+            if len(names) > 1:
+                values = itemgetter(*names)(src)
+            elif len(names) == 1:
+                values = (src[names[0]],)
+            else:
+                values = ()
+            setattr(mbook, attr, dict(zip(names, values)))
+
         return mbook
+
+@lru_cache(maxsize=None)
+def _build_template(ct_power_curve_file=None):
+    """
+    Build and cache a fully populated ModelBook
+
+    The result is shared between all ModelBook instances
+    created with the same ct_power_curve_file, hence it
+    must not be mutated.
+
+    Parameters
+    ----------
+    ct_power_curve_file: str, optional
+        The turbine curves file, forwarded to
+        flappy.WS2PCT
+
+    Returns
+    -------
+    mbook: ModelBook
+        The populated model book
+
+    """
+    mbook = ModelBook.__new__(ModelBook)
+    mbook._populate(ct_power_curve_file)
+    return mbook